@@ -6,8 +6,8 @@ import time
 import uuid
 import logging
 
-from sqlalchemy.orm import Session, Query
-from sqlalchemy import func
+from sqlalchemy.orm import Session, Query, selectin_polymorphic
+from sqlalchemy import func, inspect
 from astropy.time import Time
 from sbsearch import SBSearch, IntersectionType
 from sbsearch.target import MovingTarget, FixedTarget
@@ -124,10 +124,16 @@ class Catch(SBSearch):
         # get query identifiers for this job_id
         query_ids: list[int] = [q.query_id for q in self.queries_from_job_id(job_id)]
 
-        # get results from Found
+        # get results from Found, loading each survey's columns with one
+        # query per survey rather than one per observation
         rows: list[tuple[Found, Observation]] = (
             self.db.session.query(Found, Observation)
             .join(Observation, Found.observation_id == Observation.observation_id)
+            .options(
+                selectin_polymorphic(
+                    Observation, inspect(Observation).self_and_descendants
+                )
+            )
             .filter(Found.query_id.in_(query_ids))
             .all()
         )
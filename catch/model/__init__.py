@@ -30,7 +30,7 @@ __all__ = [
 ]
 
 import enum
-from sqlalchemy import Column, Integer, Float, String, ForeignKey, Text
+from sqlalchemy import Column, Integer, Float, String, ForeignKey, Index, Text
 from sbsearch.model.core import Base, Observation, Found, Ephemeris, Obj
 from sbsearch.model.example_survey import ExampleSurvey
 from sqlalchemy.sql.sqltypes import Boolean
@@ -54,6 +54,10 @@ class CatchQueryStatus(enum.StrEnum):
 
 class CatchQuery(Base):
     __tablename__ = f"catch_query"
+    __table_args__ = (
+        # recent query statistics filter on date and source
+        Index("ix_catch_query_date_source", "date", "source"),
+    )
     query_id = Column(
         Integer,
         primary_key=True,
@@ -97,7 +101,6 @@ class CatchQuery(Base):
     )
     date = Column(
         String(64),
-        index=True,
         doc="Date query was executed",
     )
     execution_time = Column(
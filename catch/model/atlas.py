@@ -7,6 +7,9 @@ imported and included in `__all__`.
 
 The catch survey data model additionally requires:
 
+* SurveyMixin - provides the source_id and observation_id columns.  List it
+  before Observation in the class bases.
+
 * method: cutout_url - returns a URL to retrieve a FITS formatted cutout around
   the requested sky coordinates, or else `None`.
 
@@ -18,8 +21,9 @@ The catch survey data model additionally requires:
 __all__ = ["ATLASMaunaLoa", "ATLASHaleakela", "ATLASRioHurtado", "ATLASSutherland"]
 
 from typing import Union
-from sqlalchemy import BigInteger, Column, String, Boolean, ForeignKey
+from sqlalchemy import Column, String, Boolean
 from sbsearch.model.core import Observation
+from .common import SurveyMixin
 
 
 _ARCHIVE_URL_PREFIX: str = "https://sbnsurveys.astro.umd.edu/api/images"
@@ -90,7 +94,7 @@ class ATLAS:
         return self.cutout_url(ra, dec, size=size, format=format)
 
 
-class ATLASMaunaLoa(Observation, ATLAS):
+class ATLASMaunaLoa(SurveyMixin, Observation, ATLAS):
     """ATLAS Mauna Loa
 
     Note that there are two sites on Mauna Loa:
@@ -107,15 +111,6 @@ class ATLASMaunaLoa(Observation, ATLAS):
     __obscode__ = "T08"  # MPC observatory code
     __mapper_args__ = {"polymorphic_identity": "atlas_mauna_loa"}
 
-    source_id = Column(BigInteger, primary_key=True)
-    observation_id = Column(
-        BigInteger,
-        ForeignKey(
-            "observation.observation_id", onupdate="CASCADE", ondelete="CASCADE"
-        ),
-        nullable=False,
-        index=True,
-    )
     product_id = Column(
         String(128), doc="Archive product id", unique=True, index=True, nullable=False
     )
@@ -123,7 +118,7 @@ class ATLASMaunaLoa(Observation, ATLAS):
     diff = Column(Boolean, doc="True if a difference image exists", nullable=False)
 
 
-class ATLASHaleakela(Observation, ATLAS):
+class ATLASHaleakela(SurveyMixin, Observation, ATLAS):
     """ATLAS Haleakela"""
 
     __tablename__ = "atlas_haleakela"
@@ -131,15 +126,6 @@ class ATLASHaleakela(Observation, ATLAS):
     __obscode__ = "T05"  # MPC observatory code
     __mapper_args__ = {"polymorphic_identity": "atlas_haleakela"}
 
-    source_id = Column(BigInteger, primary_key=True)
-    observation_id = Column(
-        BigInteger,
-        ForeignKey(
-            "observation.observation_id", onupdate="CASCADE", ondelete="CASCADE"
-        ),
-        nullable=False,
-        index=True,
-    )
     product_id = Column(
         String(128), doc="Archive product id", unique=True, index=True, nullable=False
     )
@@ -147,7 +133,7 @@ class ATLASHaleakela(Observation, ATLAS):
     diff = Column(Boolean, doc="True if a difference image exists", nullable=False)
 
 
-class ATLASRioHurtado(Observation, ATLAS):
+class ATLASRioHurtado(SurveyMixin, Observation, ATLAS):
     """ATLAS Chile, Rio Hurtado"""
 
     __tablename__ = "atlas_rio_hurtado"
@@ -155,15 +141,6 @@ class ATLASRioHurtado(Observation, ATLAS):
     __obscode__ = "W68"  # MPC observatory code
     __mapper_args__ = {"polymorphic_identity": "atlas_rio_hurtado"}
 
-    source_id = Column(BigInteger, primary_key=True)
-    observation_id = Column(
-        BigInteger,
-        ForeignKey(
-            "observation.observation_id", onupdate="CASCADE", ondelete="CASCADE"
-        ),
-        nullable=False,
-        index=True,
-    )
     product_id = Column(
         String(128), doc="Archive product id", unique=True, index=True, nullable=False
     )
@@ -171,7 +148,7 @@ class ATLASRioHurtado(Observation, ATLAS):
     diff = Column(Boolean, doc="True if a difference image exists", nullable=False)
 
 
-class ATLASSutherland(Observation, ATLAS):
+class ATLASSutherland(SurveyMixin, Observation, ATLAS):
     """ATLAS South Africa, Sutherland"""
 
     __tablename__ = "atlas_sutherland"
@@ -179,15 +156,6 @@ class ATLASSutherland(Observation, ATLAS):
     __obscode__ = "M22"  # MPC observatory code
     __mapper_args__ = {"polymorphic_identity": "atlas_sutherland"}
 
-    source_id = Column(BigInteger, primary_key=True)
-    observation_id = Column(
-        BigInteger,
-        ForeignKey(
-            "observation.observation_id", onupdate="CASCADE", ondelete="CASCADE"
-        ),
-        nullable=False,
-        index=True,
-    )
     product_id = Column(
         String(128), doc="Archive product id", unique=True, index=True, nullable=False
     )
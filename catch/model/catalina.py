@@ -7,9 +7,11 @@ Catalina Sky Survey archive at PDS
 
 __all__ = ["CatalinaBigelow", "CatalinaLemmon", "CatalinaBokNEOSurvey"]
 
-from typing import List, Dict
-from sqlalchemy import BigInteger, Column, String, ForeignKey
+from typing import Dict
+from functools import cached_property
+from sqlalchemy import Column, String
 from sbsearch.model.core import Observation
+from .common import SurveyMixin, cached_from
 
 _ARCHIVE_URL_PREFIX: str = (
     "https://sbnarchive.psi.edu/pds4/surveys/gbo.ast.catalina.survey/data_calibrated"
@@ -50,31 +52,40 @@ class CatalinaSkySurvey:
 
     @property
     def telescope(self) -> str:
-        tel: str = self.product_id.split(":")[5][:3].upper()
+        tel: str = self.product_id.rpartition(":")[2][:3].upper()
         return self._telescopes.get(tel)
 
-    @property
-    def archive_url(self) -> str:
-        """URL to original archive data product."""
+    @cached_property
+    def _archive_path(self) -> str:
+        """Data product path in the archive, without the file extension."""
         # generate from PDS4 LID, e.g.,
         # urn:nasa:pds:gbo.ast.catalina.survey:data_calibrated:703_20220120_2b_n02006_01_0001.arch
         # https://sbnarchive.psi.edu/pds4/surveys/gbo.ast.catalina.survey/data_calibrated/703/2022/22Jan20/703_20220120_2B_N02006_01_0001.arch.xml
-        lid: List[str] = self.product_id.split(":")
+        basename: str = self.product_id.rpartition(":")[2]
         tel: str
         date: str
-        tel, date = lid[5].split("_")[:2]
+        tel, date = basename.split("_")[:2]
         year: str = date[:4]
         Mon: str = _month_to_Mon[date[4:6]]
         day: str = date[6:]
-        i: int = lid[5].find(".")
-        prefix: str = lid[5][:i].upper()
-        suffix: str = lid[5][i:].lower() + ".fz"
-        return f"{_ARCHIVE_URL_PREFIX}/{tel.upper()}/{year}/{year[-2:]}{Mon}{day}/{prefix}{suffix}"
+        prefix: str
+        dot: str
+        suffix: str
+        prefix, dot, suffix = basename.partition(".")
+        return (
+            f"{tel.upper()}/{year}/{year[-2:]}{Mon}{day}/"
+            f"{prefix.upper()}{dot}{suffix.lower()}"
+        )
+
+    @property
+    def archive_url(self) -> str:
+        """URL to original archive data product."""
+        return f"{_ARCHIVE_URL_PREFIX}/{self._archive_path}.fz"
 
     @property
     def label_url(self) -> str:
         """URL to PDS4 label."""
-        return self.archive_url[:-2] + "xml"
+        return f"{_ARCHIVE_URL_PREFIX}/{self._archive_path}.xml"
 
     def cutout_url(
         self, ra: float, dec: float, size: float | None = None, format: str = "fits"
@@ -109,7 +120,8 @@ class CatalinaSkySurvey:
         return self.cutout_url(ra, dec, size=size, format=format)
 
 
-class CatalinaBigelow(Observation, CatalinaSkySurvey):
+@cached_from("product_id")
+class CatalinaBigelow(SurveyMixin, Observation, CatalinaSkySurvey):
     __tablename__ = "catalina_bigelow"
     __data_source_name__ = "Catalina Sky Survey, Mt. Bigelow"
     __obscode__ = "703"  # MPC observatory code
@@ -122,21 +134,13 @@ class CatalinaBigelow(Observation, CatalinaSkySurvey):
         "V06": "61-inch Kuiper telescope (V06)",
     }
 
-    source_id = Column(BigInteger, primary_key=True)
-    observation_id = Column(
-        BigInteger,
-        ForeignKey(
-            "observation.observation_id", onupdate="CASCADE", ondelete="CASCADE"
-        ),
-        nullable=False,
-        index=True,
-    )
     product_id = Column(
         String(128), doc="Archive product id", unique=True, index=True, nullable=False
     )
 
 
-class CatalinaLemmon(Observation, CatalinaSkySurvey):
+@cached_from("product_id")
+class CatalinaLemmon(SurveyMixin, Observation, CatalinaSkySurvey):
     __tablename__ = "catalina_lemmon"
     __data_source_name__ = "Catalina Sky Survey, Mt. Lemmon"
     __obscode__ = "G96"  # MPC observatory code
@@ -149,21 +153,13 @@ class CatalinaLemmon(Observation, CatalinaSkySurvey):
         "I52": "Mount Lemmon 40-inch follow-up telescope (I52)",
     }
 
-    source_id = Column(BigInteger, primary_key=True)
-    observation_id = Column(
-        BigInteger,
-        ForeignKey(
-            "observation.observation_id", onupdate="CASCADE", ondelete="CASCADE"
-        ),
-        nullable=False,
-        index=True,
-    )
     product_id = Column(
         String(128), doc="Archive product id", unique=True, index=True, nullable=False
     )
 
 
-class CatalinaBokNEOSurvey(Observation, CatalinaSkySurvey):
+@cached_from("product_id")
+class CatalinaBokNEOSurvey(SurveyMixin, Observation, CatalinaSkySurvey):
     __tablename__ = "catalina_bokneosurvey"
     __data_source_name__ = "Catalina Sky Survey Archive, Bok NEO Survey"
     __obscode__ = "V00"  # MPC observatory code
@@ -173,15 +169,6 @@ class CatalinaBokNEOSurvey(Observation, CatalinaSkySurvey):
     # MPC code : name
     _telescopes = {"V00": "Steward Observatory 90-inch Bok telescope (V00)"}
 
-    source_id = Column(BigInteger, primary_key=True)
-    observation_id = Column(
-        BigInteger,
-        ForeignKey(
-            "observation.observation_id", onupdate="CASCADE", ondelete="CASCADE"
-        ),
-        nullable=False,
-        index=True,
-    )
     product_id = Column(
         String(128), doc="Archive product id", unique=True, index=True, nullable=False
     )
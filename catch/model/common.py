@@ -0,0 +1,66 @@
+# Licensed with the 3-clause BSD license.  See LICENSE for details.
+"""common
+
+Columns and helpers shared by the survey data models.
+
+"""
+
+__all__ = ["SurveyMixin", "cached_from"]
+
+from functools import cached_property
+from sqlalchemy import BigInteger, Column, ForeignKey, event
+from sqlalchemy.orm import declared_attr
+
+
+class SurveyMixin:
+    """Columns common to all survey tables.
+
+    List before `Observation` in the bases of the survey class, otherwise
+    `Observation.observation_id` takes precedence.
+
+    """
+
+    source_id = Column(BigInteger, primary_key=True)
+
+    @declared_attr
+    def observation_id(cls):
+        # columns with foreign keys must be declared per table
+        return Column(
+            BigInteger,
+            ForeignKey(
+                "observation.observation_id", onupdate="CASCADE", ondelete="CASCADE"
+            ),
+            nullable=False,
+            index=True,
+        )
+
+
+def cached_from(*attributes: str):
+    """Class decorator that keeps cached properties in sync with columns.
+
+    Values computed by `functools.cached_property` are forgotten when any of
+    ``attributes`` is set, or when the instance is expired or refreshed by
+    the session.
+
+    """
+
+    def decorator(cls):
+        names = {
+            name
+            for base in cls.__mro__
+            for name, value in vars(base).items()
+            if isinstance(value, cached_property)
+        }
+
+        def forget(target, *args):
+            for name in names:
+                target.__dict__.pop(name, None)
+
+        for attribute in attributes:
+            event.listen(getattr(cls, attribute), "set", forget)
+        event.listen(cls, "expire", forget)
+        event.listen(cls, "refresh", forget)
+
+        return cls
+
+    return decorator
@@ -8,6 +8,9 @@ imported and included in `__all__`.
 
 The catch survey data model additionally requires:
 
+* SurveyMixin - provides the source_id and observation_id columns.  List it
+  before Observation in the class bases.
+
 * method: cutout_url - returns a URL to retrieve a FITS formatted cutout around
   the requested sky coordinates, or else `None`.
 
@@ -18,40 +21,46 @@ The catch survey data model additionally requires:
 
 __all__ = ["LONEOS"]
 
-from sqlalchemy import BigInteger, Column, String, ForeignKey
+from typing import Tuple
+from functools import cached_property
+from sqlalchemy import Column, String
 from sbsearch.model.core import Observation
+from .common import SurveyMixin, cached_from
 
 
 _ARCHIVE_URL_PREFIX: str = "https://sbnarchive.psi.edu/pds4/surveys"
 
+# LOIS versions for data taken before and after 2005 (YYMMDD = 050101)
+_LOIS_VERSIONS: Tuple[str, str] = ("lois_3_2_0_beta", "lois_4_2_0")
+
 _CUTOUT_URL_PREFIX: str = (
     "https://uxzqjwo0ye.execute-api.us-west-1.amazonaws.com/api/images"
 )
 
 
-class LONEOS(Observation):
+@cached_from("product_id")
+class LONEOS(SurveyMixin, Observation):
     __tablename__: str = "loneos"
     __data_source_name__: str = "LONEOS"
     __obscode__: str = "699"  # MPC observatory code
     __field_prefix__: str = "loneos"
 
-    source_id = Column(BigInteger, primary_key=True)
-    observation_id = Column(
-        BigInteger,
-        ForeignKey(
-            "observation.observation_id", onupdate="CASCADE", ondelete="CASCADE"
-        ),
-        nullable=False,
-        index=True,
-    )
     product_id = Column(
         String(128), doc="Archive product id", unique=True, index=True, nullable=False
     )
 
     __mapper_args__ = {"polymorphic_identity": "loneos"}
 
+    @cached_property
+    def _archive_path(self) -> str:
+        """Data product path in the archive, without the file extension."""
+        product_id: str = self.product_id.rpartition(":")[2]
+        date: str = product_id[:6]
+        lois: str = _LOIS_VERSIONS[int(date) >= 50101]
+        return f"gbo.ast.loneos.survey/data_augmented/{lois}/{date}/{product_id[:-5]}"
+
     @property
-    def archive_url(self):
+    def archive_url(self) -> str:
         """Augmented data product at PSI.
 
         urn:nasa:pds:gbo.ast.loneos.survey:data_augmented:041226_2a_082_fits
@@ -68,22 +77,12 @@ class LONEOS(Observation):
 
         """
 
-        product_id: str = self.product_id.split(":")[-1]
-        fn: str = product_id[:-5] + ".fits"
-        date: str = product_id[:6]
-
-        lois: str
-        if date < "050101":
-            lois = "lois_3_2_0_beta"
-        else:
-            lois = "lois_4_2_0"
-
-        return f"{_ARCHIVE_URL_PREFIX}/gbo.ast.loneos.survey/data_augmented/{lois}/{date}/{fn}"
+        return f"{_ARCHIVE_URL_PREFIX}/{self._archive_path}.fits"
 
     @property
     def label_url(self) -> str:
         """URL to PDS4 label."""
-        return self.archive_url[:-4] + "xml"
+        return f"{_ARCHIVE_URL_PREFIX}/{self._archive_path}.xml"
 
     def cutout_url(self, ra, dec, size=0.21, format="fits"):
         """URL to cutout ``size`` around ``ra``, ``dec`` in deg.
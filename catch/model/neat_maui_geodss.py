@@ -2,9 +2,11 @@
 
 __all__ = ["NEATMauiGEODSS"]
 
-from urllib.parse import urlencode, quote
-from sqlalchemy import BigInteger, Column, String, ForeignKey
+from functools import cached_property
+from urllib.parse import quote
+from sqlalchemy import Column, String
 from sbsearch.model.core import Observation
+from .common import SurveyMixin, cached_from
 
 
 _ARCHIVE_URL_PREFIX: str = (
@@ -14,27 +16,24 @@ _ARCHIVE_URL_PREFIX: str = (
 _CUTOUT_URL_PREFIX: str = "https://sbnsurveys.astro.umd.edu/api/images"
 
 
-class NEATMauiGEODSS(Observation):
+@cached_from("product_id")
+class NEATMauiGEODSS(SurveyMixin, Observation):
     __tablename__ = "neat_maui_geodss"
     __data_source_name__ = "NEAT Maui GEODSS"
     __obscode__ = "566"
     __field_prefix__ = "neat"
 
-    source_id = Column(BigInteger, primary_key=True)
-    observation_id = Column(
-        BigInteger,
-        ForeignKey(
-            "observation.observation_id", onupdate="CASCADE", ondelete="CASCADE"
-        ),
-        nullable=False,
-        index=True,
-    )
     product_id = Column(
         String(100), doc="Archive product id", unique=True, index=True, nullable=False
     )
 
     __mapper_args__ = {"polymorphic_identity": "neat_maui_geodss"}
 
+    @cached_property
+    def _archive_path(self) -> str:
+        """Data product path in the archive, without the file extension."""
+        return self.product_id.rpartition(":")[2].replace("_", "/")
+
     @property
     def archive_url(self) -> str:
         """URL to original data product.
@@ -50,12 +49,7 @@ class NEATMauiGEODSS(Observation):
         #    f"urn:nasa:pds:gbo.ast.neat.survey:data_geodss:{str(self.product_id).lower()}"
         # )
 
-        product_id = self.product_id[self.product_id.rindex(":") + 1 :]
-        path = product_id.replace("_", "/")
-
-        url = f"{_ARCHIVE_URL_PREFIX}/{path}.fit.fz"
-
-        return url
+        return f"{_ARCHIVE_URL_PREFIX}/{self._archive_path}.fit.fz"
 
     @property
     def label_url(self) -> str:
@@ -68,7 +62,7 @@ class NEATMauiGEODSS(Observation):
 
         """
 
-        return self.archive_url[:-6] + "xml"
+        return f"{_ARCHIVE_URL_PREFIX}/{self._archive_path}.xml"
 
     def cutout_url(self, ra, dec, size=0.12, format="fits") -> str:
         """URL to cutout ``size`` around ``ra``, ``dec`` in deg.
@@ -84,16 +78,17 @@ class NEATMauiGEODSS(Observation):
 
         """
 
-        query_string = urlencode(
-            {
-                "ra": float(ra),
-                "dec": float(dec),
-                "size": "{:.2f}arcmin".format(float(size) * 60),
-                "format": str(format),
-            }
-        )
+        # coerce anything else, e.g., int or str, to float, which along with
+        # format names does not need URL encoding
+        ra = ra if isinstance(ra, float) else float(ra)
+        dec = dec if isinstance(dec, float) else float(dec)
+        size = size if isinstance(size, float) else float(size)
 
-        return f"{_CUTOUT_URL_PREFIX}/{self.product_id}?{query_string}"
+        return (
+            f"{_CUTOUT_URL_PREFIX}/{self.product_id}"
+            f"?ra={ra}&dec={dec}&size={size * 60:.2f}arcmin"
+            f"&format={format}"
+        )
 
     def preview_url(self, ra, dec, size=0.12, format="jpeg"):
         """Web preview image for cutout."""
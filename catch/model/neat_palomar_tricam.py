@@ -8,6 +8,9 @@ imported and included in `__all__`.
 
 The catch survey data model additionally requires:
 
+* SurveyMixin - provides the source_id and observation_id columns.  List it
+  before Observation in the class bases.
+
 * __field_prefix__ - a string used to prefix survey-specific columns in
   aggregated (i.e., multi-survey) output.  Verify that the string length can be
   stored by this column data type.
@@ -28,9 +31,11 @@ The catch survey data model additionally requires:
 
 __all__ = ["NEATPalomarTricam"]
 
-from urllib.parse import urlencode, quote
-from sqlalchemy import BigInteger, Column, String, ForeignKey
+from functools import cached_property
+from urllib.parse import quote
+from sqlalchemy import Column, String
 from sbsearch.model.core import Observation
+from .common import SurveyMixin, cached_from
 
 
 _ARCHIVE_URL_PREFIX: str = (
@@ -40,27 +45,24 @@ _ARCHIVE_URL_PREFIX: str = (
 _CUTOUT_URL_PREFIX: str = "https://sbnsurveys.astro.umd.edu/api/images"
 
 
-class NEATPalomarTricam(Observation):
+@cached_from("product_id")
+class NEATPalomarTricam(SurveyMixin, Observation):
     __tablename__: str = "neat_palomar_tricam"
     __data_source_name__: str = "NEAT Palomar Tricam"
     __obscode__: str = "644"  # MPC observatory code
     __field_prefix__: str = "neat"
 
-    source_id = Column(BigInteger, primary_key=True)
-    observation_id = Column(
-        BigInteger,
-        ForeignKey(
-            "observation.observation_id", onupdate="CASCADE", ondelete="CASCADE"
-        ),
-        nullable=False,
-        index=True,
-    )
     product_id = Column(
         String(100), doc="Archive product id", unique=True, index=True, nullable=False
     )
 
     __mapper_args__ = {"polymorphic_identity": "neat_palomar_tricam"}
 
+    @cached_property
+    def _archive_path(self) -> str:
+        """Data product path in the archive, without the file extension."""
+        return self.product_id.rpartition(":")[2].replace("_", "/")
+
     @property
     def archive_url(self) -> str:
         """URL to original data product.
@@ -76,10 +78,7 @@ class NEATPalomarTricam(Observation):
         #     f"urn:nasa:pds:gbo.ast.neat.survey:data_tricam:{str(self.product_id).lower()}"
         # )
 
-        product_id = self.product_id[self.product_id.rindex(":") + 1 :]
-        path = product_id.replace("_", "/")
-
-        return f"{_ARCHIVE_URL_PREFIX}/{path}.fit.fz"
+        return f"{_ARCHIVE_URL_PREFIX}/{self._archive_path}.fit.fz"
 
     @property
     def label_url(self) -> str:
@@ -92,7 +91,7 @@ class NEATPalomarTricam(Observation):
 
         """
 
-        return self.archive_url[:-6] + "xml"
+        return f"{_ARCHIVE_URL_PREFIX}/{self._archive_path}.xml"
 
     def cutout_url(self, ra, dec, size=0.12, format="fits") -> str:
         """URL to cutout ``size`` around ``ra``, ``dec`` in deg.
@@ -106,16 +105,17 @@ class NEATPalomarTricam(Observation):
 
         """
 
-        query_string = urlencode(
-            {
-                "ra": float(ra),
-                "dec": float(dec),
-                "size": "{:.2f}arcmin".format(float(size) * 60),
-                "format": str(format),
-            }
-        )
+        # coerce anything else, e.g., int or str, to float, which along with
+        # format names does not need URL encoding
+        ra = ra if isinstance(ra, float) else float(ra)
+        dec = dec if isinstance(dec, float) else float(dec)
+        size = size if isinstance(size, float) else float(size)
 
-        return f"{_CUTOUT_URL_PREFIX}/{self.product_id}?{query_string}"
+        return (
+            f"{_CUTOUT_URL_PREFIX}/{self.product_id}"
+            f"?ra={ra}&dec={dec}&size={size * 60:.2f}arcmin"
+            f"&format={format}"
+        )
 
     def preview_url(self, ra, dec, size=0.12, format="jpeg"):
         """Web preview image."""
@@ -7,26 +7,26 @@ PanSTARRS 1 Data Release 2
 
 __all__ = ["PS1DR2"]
 
+from functools import cached_property
 from urllib.parse import quote
-from sqlalchemy import BigInteger, Column, Integer, SmallInteger, String, ForeignKey
+from sqlalchemy import Column, Integer, SmallInteger, String
 from sbsearch.model.core import Base, Observation
+from .common import SurveyMixin, cached_from
 
+_WARP_PATH_PREFIX: str = "/rings.v3.skycell"
 
-class PS1DR2(Observation):
+_PIXEL_SCALE: float = 0.25  # arcsec/pixel
+_DEFAULT_CUTOUT_SIZE: float = 0.05  # deg
+_DEFAULT_CUTOUT_PIXELS: int = int(_DEFAULT_CUTOUT_SIZE * 3600 / _PIXEL_SCALE)
+
+
+@cached_from("projection_id", "skycell_id", "product_id")
+class PS1DR2(SurveyMixin, Observation):
     __tablename__ = "ps1dr2"
     __data_source_name__ = "PanSTARRS 1 DR2"
     __obscode__ = "F51"  # MPC observatory code
     __field_prefix__ = "ps1"
 
-    source_id = Column(BigInteger, primary_key=True)
-    observation_id = Column(
-        BigInteger,
-        ForeignKey(
-            "observation.observation_id", onupdate="CASCADE", ondelete="CASCADE"
-        ),
-        nullable=False,
-        index=True,
-    )
     product_id = Column(
         String(64), doc="Archive product id", unique=True, index=True, nullable=False
     )
@@ -38,14 +38,20 @@ class PS1DR2(Observation):
 
     __mapper_args__ = {"polymorphic_identity": "ps1dr2"}
 
-    @property
+    @cached_property
     def _warp_path(self) -> str:
+        """Warp image path in the archive, formatted once per instance."""
         url: str = (
-            f"/rings.v3.skycell/{self.projection_id:04d}/"
+            f"{_WARP_PATH_PREFIX}/{self.projection_id:04d}/"
             f"{self.skycell_id:03d}/{self.product_id}"
         )
         return url
 
+    @cached_property
+    def _quoted_warp_path(self) -> str:
+        """Warp image path encoded for use as a URL query parameter."""
+        return quote(self._warp_path, safe="")
+
     @property
     def archive_url(self) -> str:
         """Get URL to this PS1 DR2 skycell warp image.
@@ -58,7 +64,11 @@ class PS1DR2(Observation):
         return url
 
     def cutout_url(
-        self, ra: float, dec: float, size: float = 0.05, format: str = "fits"
+        self,
+        ra: float,
+        dec: float,
+        size: float = _DEFAULT_CUTOUT_SIZE,
+        format: str = "fits",
     ) -> str:
         """URL to cutout ``size`` around ``ra``, ``dec`` in deg.
 
@@ -68,10 +78,15 @@ class PS1DR2(Observation):
         format = fits, jpeg, png
 
         """
-        pixels: int = int(size * 3600 / 0.25)  # 0.25"/pixel
+        pixels: int = (
+            _DEFAULT_CUTOUT_PIXELS
+            if size == _DEFAULT_CUTOUT_SIZE
+            else int(size * 3600 / _PIXEL_SCALE)
+        )
+
         url: str = (
             "https://ps1images.stsci.edu/cgi-bin/fitscut.cgi?"
-            f"red={quote(self._warp_path, safe='')}&ra={ra}&dec={dec}"
+            f"red={self._quoted_warp_path}&ra={ra}&dec={dec}"
             f"&size={pixels}&format={format}"
         )
         return url
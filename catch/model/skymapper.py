@@ -1,27 +1,21 @@
 # Licensed with the 3-clause BSD license.  See LICENSE for details.
 
 from typing import List
-from sqlalchemy import BigInteger, Column, Integer, String, Float, ForeignKey
+from sqlalchemy import Column, Integer, String, Float
 from sbsearch.model.core import Base, Observation
+from .common import SurveyMixin
 
 __all__: List[str] = ["SkyMapperDR4"]
 
+_CUTOUT_URL_PREFIX: str = "https://api.skymapper.nci.org.au/public/siap/dr4/get_image"
 
-class SkyMapperDR4(Observation):
+
+class SkyMapperDR4(SurveyMixin, Observation):
     __tablename__ = "skymapper_dr4"
     __data_source_name__ = "SkyMapperDR4"
     __obscode__ = "413"
     __field_prefix__ = "skymapper"
 
-    source_id = Column(BigInteger, primary_key=True)
-    observation_id = Column(
-        BigInteger,
-        ForeignKey(
-            "observation.observation_id", onupdate="CASCADE", ondelete="CASCADE"
-        ),
-        nullable=False,
-        index=True,
-    )
     product_id = Column(
         String(64), doc="Archive product id", unique=True, index=True, nullable=False
     )
@@ -55,10 +49,13 @@ class SkyMapperDR4(Observation):
         """
 
         return (
-            "https://api.skymapper.nci.org.au/public/siap/dr4/get_image?"
+            f"{_CUTOUT_URL_PREFIX}?"
             f"IMAGE={self.product_id}&SIZE={size}&POS={ra},{dec}&FORMAT={format}"
         )
 
     def preview_url(self, ra, dec, size=0.0833):
         """Web preview image for cutout."""
-        return self.cutout_url(ra, dec, size=size, format="png")
+        return (
+            f"{_CUTOUT_URL_PREFIX}?"
+            f"IMAGE={self.product_id}&SIZE={size}&POS={ra},{dec}&FORMAT=png"
+        )
@@ -8,6 +8,9 @@ imported and included in `__all__`.
 
 The catch survey data model additionally requires:
 
+* SurveyMixin - provides the source_id and observation_id columns.  List it
+  before Observation in the class bases.
+
 * method: cutout_url - returns a URL to retrieve a FITS formatted cutout around
   the requested sky coordinates, or else `None`.
 
@@ -18,8 +21,10 @@ The catch survey data model additionally requires:
 
 __all__ = ["Spacewatch"]
 
-from sqlalchemy import BigInteger, Column, String, ForeignKey
+from functools import cached_property
+from sqlalchemy import Column, String
 from sbsearch.model.core import Base, Observation
+from .common import SurveyMixin, cached_from
 
 
 _ARCHIVE_URL_PREFIX: str = (
@@ -31,21 +36,13 @@ _CUTOUT_URL_PREFIX: str = (
 )
 
 
-class Spacewatch(Observation):
+@cached_from("product_id", "file_name")
+class Spacewatch(SurveyMixin, Observation):
     __tablename__: str = "spacewatch"
     __data_source_name__: str = "Spacewatch"
     __obscode__: str = "691"  # MPC observatory code
     __field_prefix__: str = "spacewatch"
 
-    source_id = Column(BigInteger, primary_key=True)
-    observation_id = Column(
-        BigInteger,
-        ForeignKey(
-            "observation.observation_id", onupdate="CASCADE", ondelete="CASCADE"
-        ),
-        nullable=False,
-        index=True,
-    )
     product_id: str = Column(
         String(128), doc="Archive product id", unique=True, index=True, nullable=False
     )
@@ -57,15 +54,26 @@ class Spacewatch(Observation):
 
     __mapper_args__ = {"polymorphic_identity": "spacewatch"}
 
+    @cached_property
+    def _archive_path(self) -> str:
+        """Data product path in the archive."""
+        y, m, d = self.product_id.rpartition(":")[2].split("_")[-6:-3]
+        return f"{y}/{m}/{d}/{self.file_name}"
+
+    @cached_property
+    def _cased_lid(self) -> str:
+        """Product ID with the case of the file name."""
+        # fix the case to match the file_name, at bit of a hack, but will work
+        # until we have a better image service deployed
+        return self.product_id[: -len(self.file_name)] + self.file_name
+
     @property
     def label_url(self):
-        return self.archive_url[:-4] + "xml"
+        return f"{_ARCHIVE_URL_PREFIX}/{self._archive_path[:-4]}xml"
 
     @property
     def archive_url(self):
-        product_id = self.product_id[self.product_id.rindex(":") + 1 :]
-        y, m, d = product_id.split("_")[-6:-3]
-        return f"{_ARCHIVE_URL_PREFIX}/{y}/{m}/{d}/{self.file_name}"
+        return f"{_ARCHIVE_URL_PREFIX}/{self._archive_path}"
 
     def cutout_url(
         self, ra: float, dec: float, size: float = 0.0833, format: str = "fits"
@@ -80,13 +88,8 @@ class Spacewatch(Observation):
 
         size_arcmin: float = max(0.01, size * 60)
 
-        # fix the case to match the file_name, at bit of a hack, but will work
-        # until we have a better image service deployed
-
-        lid = self.product_id
-        cased_lid = lid[: -len(self.file_name)] + self.file_name
         return (
-            f"{_CUTOUT_URL_PREFIX}/{cased_lid}"
+            f"{_CUTOUT_URL_PREFIX}/{self._cased_lid}"
             f"?ra={ra}&dec={dec}&size={size_arcmin:.2f}arcmin"
             f"&format={format}"
         )
@@ -4,7 +4,7 @@
 
 from sqlalchemy.orm import Query
 from sqlalchemy.orm.exc import NoResultFound
-from sqlalchemy import func, Row
+from sqlalchemy import func, select, Row
 
 from astropy.time import Time
 
@@ -15,18 +15,18 @@ from .catch import Catch
 def source_statistics(catch: Catch) -> list[dict[str, str | int | None]]:
     """Get source statistics from survey statistics table."""
 
-    rows = []
-    stat: SurveyStats
-    for stat in catch.db.session.query(SurveyStats).order_by(SurveyStats.name).all():
-        rows.append(
-            {
-                "source": stat.source,
-                "name": stat.name,
-                "start-date": stat.start_date,
-                "stop-date": stat.stop_date,
-                "count": stat.count,
-            }
-        )
+    rows: list[dict[str, str | int | None]] = [
+        dict(row)
+        for row in catch.db.session.execute(
+            select(
+                SurveyStats.source,
+                SurveyStats.name,
+                SurveyStats.start_date.label("start-date"),
+                SurveyStats.stop_date.label("stop-date"),
+                SurveyStats.count,
+            ).order_by(SurveyStats.name)
+        ).mappings()
+    ]
 
     return rows
 
@@ -54,35 +54,66 @@ def recently_added_observations(
 
     """
 
+    # catch.sources is rebuilt on each access
+    source_names: dict[str, str] = {
+        name: source.__data_source_name__ for name, source in catch.sources.items()
+    }
     if sources is None:
-        sources = catch.sources.keys()
+        sources = list(source_names)
 
-    summary: list[dict[str, str | int | None]] = []
+    days: list[int] = [1, 7, 30]
     t0: float = Time.now().mjd
-    for n in [1, 7, 30]:
-        results: list[Row] = (
-            catch.db.session.query(
-                Observation.source,
-                func.count(Observation.mjd_start).label("count"),
-                func.min(Observation.mjd_start).label("start_date"),
-                func.max(Observation.mjd_stop).label("stop_date"),
-            )
-            .where(Observation.mjd_added > (t0 - n))
-            .group_by(Observation.source)
-            .all()
+
+    # one scan over the longest period, with per-period aggregates
+    columns: list = [Observation.source]
+    for n in days:
+        added = Observation.mjd_added > (t0 - n)
+        columns.extend(
+            [
+                func.count(Observation.mjd_start).filter(added).label(f"count_{n}"),
+                func.min(Observation.mjd_start).filter(added).label(f"start_{n}"),
+                func.max(Observation.mjd_stop).filter(added).label(f"stop_{n}"),
+            ]
+        )
+
+    results: list[Row] = (
+        catch.db.session.query(*columns)
+        .where(
+            (Observation.mjd_added > (t0 - max(days))) & Observation.source.in_(sources)
+        )
+        .group_by(Observation.source)
+        .all()
+    )
+
+    selected: list[tuple[int, Row]] = [
+        (n, row) for n in days for row in results if getattr(row, f"count_{n}") > 0
+    ]
+
+    # convert all dates with a single Time object
+    dates: list[list[str]] = (
+        Time(
+            [
+                (getattr(row, f"start_{n}"), getattr(row, f"stop_{n}"))
+                for n, row in selected
+            ],
+            format="mjd",
+        )
+        .iso.reshape(-1, 2)
+        .tolist()
+    )
+
+    summary: list[dict[str, str | int | None]] = []
+    for (n, row), (start_date, stop_date) in zip(selected, dates):
+        summary.append(
+            {
+                "source": row.source,
+                "source_name": source_names[row.source],
+                "days": n,
+                "count": getattr(row, f"count_{n}"),
+                "start_date": start_date,
+                "stop_date": stop_date,
+            }
         )
-        for row in results:
-            if row.source in sources:
-                summary.append(
-                    {
-                        "source": row.source,
-                        "source_name": catch.sources[row.source].__data_source_name__,
-                        "days": n,
-                        "count": row.count,
-                        "start_date": Time(row.start_date, format="mjd").iso,
-                        "stop_date": Time(row.stop_date, format="mjd").iso,
-                    }
-                )
     return summary
 
 
@@ -110,39 +141,56 @@ def recent_queries(
     """
 
     if sources is None:
-        sources = catch.sources.keys()
+        sources = list(catch.sources)
 
-    t0 = Time.now().mjd
+    days: list[int] = [1, 7, 30]
+    t0: float = Time.now().mjd
 
-    summary: list[dict[str, str | int | None]] = []
-    for n in [1, 7, 30]:
-        # only summarize sources known to us
-        q = catch.db.session.query(
-            func.count(func.distinct(CatchQuery.job_id)).label("jobs"),
-            func.count((CatchQuery.status == "finished") | None).label("finished"),
-            (
-                func.count(CatchQuery.status == "finished")
-                - func.count(CatchQuery.execution_time)
-            ).label("cached"),
-            func.count((CatchQuery.status == "errored") | None).label("errored"),
-            func.count((CatchQuery.status == "in progress") | None).label(
-                "in_progress"
-            ),
-        ).where(
-            (CatchQuery.date > Time(t0 - n, format="mjd").iso)
-            & CatchQuery.source.in_(sources)
+    since: dict[int, str] = dict(
+        zip(days, Time([t0 - n for n in days], format="mjd").iso.tolist())
+    )
+
+    # one scan over the longest period, with per-period aggregates
+    columns: list = []
+    for n in days:
+        recent = CatchQuery.date > since[n]
+        finished = recent & (CatchQuery.status == "finished")
+        columns.extend(
+            [
+                func.count(func.distinct(CatchQuery.job_id))
+                .filter(recent)
+                .label(f"jobs_{n}"),
+                func.count().filter(finished).label(f"finished_{n}"),
+                # cached results are finished without an execution time
+                func.count()
+                .filter(finished & CatchQuery.execution_time.is_(None))
+                .label(f"cached_{n}"),
+                func.count()
+                .filter(recent & (CatchQuery.status == "errored"))
+                .label(f"errored_{n}"),
+                func.count()
+                .filter(recent & (CatchQuery.status == "in progress"))
+                .label(f"in_progress_{n}"),
+            ]
         )
 
-        result: Row = q.one()
+    # only summarize sources known to us
+    result: Row = (
+        catch.db.session.query(*columns)
+        .where((CatchQuery.date > since[max(days)]) & CatchQuery.source.in_(sources))
+        .one()
+    )
 
+    summary: list[dict[str, str | int | None]] = []
+    for n in days:
         summary.append(
             {
                 "days": n,
-                "jobs": result.jobs,
-                "finished": result.finished,
-                "cached": result.cached,
-                "errored": result.errored,
-                "in_progress": result.in_progress,
+                "jobs": getattr(result, f"jobs_{n}"),
+                "finished": getattr(result, f"finished_{n}"),
+                "cached": getattr(result, f"cached_{n}"),
+                "errored": getattr(result, f"errored_{n}"),
+                "in_progress": getattr(result, f"in_progress_{n}"),
             }
         )
     return summary
@@ -167,46 +215,94 @@ def update_statistics(catch: Catch, source: str | None = None) -> None:
         # just the requested table
         sources = [catch.sources.get(source, source)]
 
+    summary = _observation_summary(catch, sources)
+    survey_stats = _survey_stats(catch, sources)
     for s in sources:
-        update_statistics_for_source(catch, s)
+        update_statistics_for_source(
+            catch, s, summary[s.__tablename__], survey_stats[s.__tablename__]
+        )
 
     update_statistics_for_all(catch)
 
     catch.db.session.commit()
 
 
-def update_statistics_for_source(catch: Catch, source: str) -> None:
-    """Update statistics for a single source."""
-    count: int = catch.db.session.query(func.count(source.observation_id)).scalar()
-
-    q: Query = catch.db.session.query(
-        func.min(Observation.mjd_start), func.max(Observation.mjd_stop)
-    ).filter(Observation.source == source.__tablename__)
-    dates: Row = q.one()
+def _observation_summary(
+    catch: Catch, sources: list[Observation]
+) -> dict[str, tuple[int, float | None, float | None]]:
+    """Observation count, first start date, and last stop date for each source."""
 
-    table_name = source.__tablename__
-    source_name = source.__data_source_name__
+    table_names: list[str] = [source.__tablename__ for source in sources]
+    summary: dict[str, tuple[int, float | None, float | None]] = {
+        table_name: (0, None, None) for table_name in table_names
+    }
 
-    stats: SurveyStats
-    try:
-        stats = (
-            catch.db.session.query(SurveyStats)
-            .filter(SurveyStats.source == table_name)
-            .one()
+    # every survey row has exactly one observation row with the same source
+    rows: list[Row] = catch.db.session.execute(
+        select(
+            Observation.source,
+            func.count(),
+            func.min(Observation.mjd_start),
+            func.max(Observation.mjd_stop),
         )
-    except NoResultFound:
-        stats = SurveyStats(
-            source=table_name,
-            name=source_name,
+        .where(Observation.source.in_(table_names))
+        .group_by(Observation.source)
+    ).all()
+    summary.update((row[0], tuple(row[1:])) for row in rows)
+
+    return summary
+
+
+def _survey_stats(catch: Catch, sources: list[Observation]) -> dict[str, SurveyStats]:
+    """Survey statistics rows for each source, new rows if not yet present."""
+
+    table_names: list[str] = [source.__tablename__ for source in sources]
+    survey_stats: dict[str, SurveyStats] = {
+        stats.source: stats
+        for stats in catch.db.session.query(SurveyStats).filter(
+            SurveyStats.source.in_(table_names)
         )
+    }
+
+    for source in sources:
+        if source.__tablename__ not in survey_stats:
+            survey_stats[source.__tablename__] = SurveyStats(
+                source=source.__tablename__,
+                name=source.__data_source_name__,
+            )
+
+    return survey_stats
+
+
+def update_statistics_for_source(
+    catch: Catch,
+    source: Observation,
+    summary: tuple[int, float | None, float | None] | None = None,
+    stats: SurveyStats | None = None,
+) -> None:
+    """Update statistics for a single source.
+
+    ``summary`` is the source's observation count, first start date, and last
+    stop date, as returned by ``_observation_summary``, and ``stats`` is the
+    row to update, as returned by ``_survey_stats``.  Both are queried if not
+    provided.
+
+    """
+
+    if summary is None:
+        summary = _observation_summary(catch, [source])[source.__tablename__]
+    count, start, stop = summary
+
+    if stats is None:
+        stats = _survey_stats(catch, [source])[source.__tablename__]
 
     stats.count = count
     if count > 0:
-        stats.start_date = Time(dates[0], format="mjd").iso
-        stats.stop_date = Time(dates[1], format="mjd").iso
+        stats.start_date = Time(start, format="mjd").iso
+        stats.stop_date = Time(stop, format="mjd").iso
     stats.updated = Time.now().iso
 
-    catch.db.session.merge(stats)
+    catch.db.session.add(stats)
 
 
 def update_statistics_for_all(catch: Catch) -> None:
@@ -0,0 +1,44 @@
+# Licensed with the 3-clause BSD license.  See LICENSE for details.
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+import testing.postgresql
+
+from ..catch import Catch
+from .surveys import dummy_surveys
+
+
+@pytest.fixture(name="postgresql", scope="session")
+def fixture_postgresql():
+    """Database server with the dummy surveys, shared by all tests."""
+    with testing.postgresql.Postgresql() as postgresql:
+        dummy_surveys(postgresql)
+        yield postgresql
+
+
+@pytest.fixture(name="engine", scope="session")
+def fixture_engine(postgresql):
+    """Database engine shared by all tests."""
+    engine = sa.create_engine(postgresql.url())
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(name="catch")
+def fixture_catch(engine):
+    """Catch instance with its changes rolled back after each test.
+
+    The session joins an external transaction, and commits by Catch only
+    release savepoints within it.
+
+    """
+
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        session = Session(bind=connection, join_transaction_mode="create_savepoint")
+        try:
+            yield Catch(session, debug=True)
+        finally:
+            session.close()
+            transaction.rollback()
@@ -0,0 +1,56 @@
+# Licensed with the 3-clause BSD license.  See LICENSE for details.
+"""Dummy survey data for the test database."""
+
+import numpy as np
+from astropy.time import Time
+
+from ..catch import Catch
+from ..config import Config
+from ..model import NEATMauiGEODSS, NEATPalomarTricam
+
+
+# dummy_surveys survey parameters
+GEODSS_START = 50814.0
+TRICAM_OFFSET = 1461
+EXPTIME = 30 / 86400
+SLEWTIME = 7 / 86400
+
+# field of view corners (ra, dec) relative to the center, deg
+FOV_TEMPLATE = np.array(((-0.5, 0.5, 0.5, -0.5), (-0.5, -0.5, 0.5, 0.5))) * 5
+FOV_TEMPLATE.setflags(write=False)
+
+
+def dummy_surveys(postgresql):
+    # field centers, then all fields of view with one broadcast
+    decs = np.linspace(-30, 90, 36)
+    n_ras = (36 * np.cos(np.radians(decs))).astype(int)
+    ras = np.concatenate([np.linspace(0, 360, n) for n in n_ras])
+    centers = np.stack((ras, np.repeat(decs, n_ras)), axis=1)
+    fovs = FOV_TEMPLATE + centers[:, :, np.newaxis]  # (N, 2, 4)
+
+    mjd_starts = GEODSS_START + np.arange(len(fovs)) * (EXPTIME + SLEWTIME)
+
+    observations = []
+    now = Time.now().mjd
+    for product_id, (mjd_start, _fov) in enumerate(zip(mjd_starts.tolist(), fovs), 1):
+        obs = NEATMauiGEODSS(
+            mjd_start=mjd_start,
+            mjd_stop=mjd_start + EXPTIME,
+            product_id=product_id,
+            mjd_added=now + 0.1 - product_id,
+        )
+        obs.set_fov(*_fov)
+        observations.append(obs)
+
+        obs = NEATPalomarTricam(
+            mjd_start=mjd_start + TRICAM_OFFSET,
+            mjd_stop=mjd_start + EXPTIME + TRICAM_OFFSET,
+            product_id=product_id,
+            mjd_added=now + 0.1 - product_id,
+        )
+        obs.set_fov(*_fov)
+        observations.append(obs)
+
+    config = Config(database=postgresql.url(), log="/dev/null", debug=True)
+    with Catch.with_config(config) as catch:
+        catch.add_observations(observations)
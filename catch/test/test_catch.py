@@ -1,17 +1,17 @@
 # Licensed with the 3-clause BSD license.  See LICENSE for details.
 
 import uuid
+from collections import Counter
 from typing import List
 
 import pytest
 import numpy as np
 from astropy.time import Time
 import sqlalchemy as sa
-import testing.postgresql
 
 from sbsearch.target import MovingTarget, FixedTarget
+from .. import stats
 from ..catch import Catch
-from ..config import Config
 from ..model import (
     CatchQuery,
     NEATMauiGEODSS,
@@ -24,62 +24,7 @@ from ..model import (
     PS1DR2,
     LONEOS,
 )
-
-
-# dummy_surveys survey parameters
-GEODSS_START = 50814.0
-TRICAM_OFFSET = 1461
-EXPTIME = 30 / 86400
-SLEWTIME = 7 / 86400
-
-
-def dummy_surveys(postgresql):
-    mjd_start = GEODSS_START
-    fov = np.array(((-0.5, 0.5, 0.5, -0.5), (-0.5, -0.5, 0.5, 0.5))) * 5
-    observations = []
-    product_id = 0
-    now = Time.now().mjd
-    for dec in np.linspace(-30, 90, 36):
-        for ra in np.linspace(0, 360, int(36 * np.cos(np.radians(dec)))):
-            product_id += 1
-            _fov = fov + np.array([[ra], [dec]])
-            obs = NEATMauiGEODSS(
-                mjd_start=mjd_start,
-                mjd_stop=mjd_start + EXPTIME,
-                product_id=product_id,
-                mjd_added=now + 0.1 - product_id,
-            )
-            obs.set_fov(*_fov)
-            observations.append(obs)
-
-            obs = NEATPalomarTricam(
-                mjd_start=mjd_start + TRICAM_OFFSET,
-                mjd_stop=mjd_start + EXPTIME + TRICAM_OFFSET,
-                product_id=product_id,
-                mjd_added=now + 0.1 - product_id,
-            )
-            obs.set_fov(*_fov)
-            observations.append(obs)
-
-            mjd_start += EXPTIME + SLEWTIME
-
-    config = Config(database=postgresql.url(), log="/dev/null", debug=True)
-    with Catch.with_config(config) as catch:
-        catch.add_observations(observations)
-        catch.update_statistics()
-
-
-Postgresql = testing.postgresql.PostgresqlFactory(
-    cache_initialized_db=True, on_initialized=dummy_surveys
-)
-
-
-@pytest.fixture(name="catch")
-def fixture_catch():
-    with Postgresql() as postgresql:
-        config = Config(database=postgresql.url(), log="/dev/null", debug=True)
-        with Catch.with_config(config) as catch:
-            yield catch
+from .surveys import GEODSS_START, TRICAM_OFFSET, EXPTIME, SLEWTIME, FOV_TEMPLATE
 
 
 def test_skymapper_dr4_url():
@@ -90,35 +35,9 @@ def test_skymapper_dr4_url():
         "https://api.skymapper.nci.org.au/public/siap/dr4/get_image?"
         f"IMAGE={obs.product_id}&SIZE=0.1&POS={found.ra},{found.dec}&FORMAT=fits"
     )
-
-
-def test_css_urls():
-    obs = CatalinaLemmon(
-        product_id="urn:nasa:pds:gbo.ast.catalina.survey:data_calibrated:g96_20220130_2b_n27011_01_0001.arch"
-    )
-    assert obs.archive_url == (
-        "https://sbnarchive.psi.edu/pds4/surveys/gbo.ast.catalina.survey/data_calibrated/G96/2022/22Jan30/"
-        "G96_20220130_2B_N27011_01_0001.arch.fz"
-    )
-    assert obs.label_url == (
-        "https://sbnarchive.psi.edu/pds4/surveys/gbo.ast.catalina.survey/data_calibrated/G96/2022/22Jan30/"
-        "G96_20220130_2B_N27011_01_0001.arch.xml"
-    )
-
-    found = Found(ra=12.3, dec=-4.56)
-
-    url = obs.cutout_url(found.ra, found.dec, size=0.1)
-    assert url == (
-        "https://uxzqjwo0ye.execute-api.us-west-1.amazonaws.com/api/images/"
-        "urn:nasa:pds:gbo.ast.catalina.survey:data_calibrated:g96_20220130_2b_n27011_01_0001.arch"
-        "?ra=12.3&dec=-4.56&size=6.00arcmin&format=fits"
-    )
-
-    url = obs.preview_url(found.ra, found.dec, size=0.1)
-    assert url == (
-        "https://uxzqjwo0ye.execute-api.us-west-1.amazonaws.com/api/images/"
-        "urn:nasa:pds:gbo.ast.catalina.survey:data_calibrated:g96_20220130_2b_n27011_01_0001.arch"
-        "?ra=12.3&dec=-4.56&size=6.00arcmin&format=jpeg"
+    assert obs.preview_url(found.ra, found.dec) == (
+        "https://api.skymapper.nci.org.au/public/siap/dr4/get_image?"
+        f"IMAGE={obs.product_id}&SIZE=0.0833&POS={found.ra},{found.dec}&FORMAT=png"
     )
 
 
@@ -154,102 +73,127 @@ def test_loneos_cutout_url(lid, ra, dec, expected):
     assert url == expected[:-4] + "jpeg"
 
 
-def test_sw_urls():
-    obs = Spacewatch(
-        product_id=(
-            "urn:nasa:pds:gbo.ast.spacewatch.survey:data:"
-            "sw_0996_sw403s_2003_07_08_08_40_33.001.fits"
+@pytest.mark.parametrize(
+    "lid, expected",
+    [
+        (
+            "urn:nasa:pds:gbo.ast.loneos.survey:data_augmented:041226_2a_082_fits",
+            "https://sbnarchive.psi.edu/pds4/surveys/gbo.ast.loneos.survey/data_augmented/"
+            "lois_3_2_0_beta/041226/041226_2a_082.fits",
         ),
-        file_name="sw_0996_SW403s_2003_07_08_08_40_33.001.fits",
-    )
-    assert obs.archive_url == (
-        "https://sbnarchive.psi.edu/pds4/surveys/gbo.ast.spacewatch.survey/data/2003/07/08/"
-        "sw_0996_SW403s_2003_07_08_08_40_33.001.fits"
-    )
-    assert obs.label_url == (
-        "https://sbnarchive.psi.edu/pds4/surveys/gbo.ast.spacewatch.survey/data/2003/07/08/"
-        "sw_0996_SW403s_2003_07_08_08_40_33.001.xml"
-    )
-
-    found = Found(ra=12.3, dec=-4.56)
+        (
+            "urn:nasa:pds:gbo.ast.loneos.survey:data_augmented:051113_1a_011_fits",
+            "https://sbnarchive.psi.edu/pds4/surveys/gbo.ast.loneos.survey/data_augmented/"
+            "lois_4_2_0/051113/051113_1a_011.fits",
+        ),
+    ],
+)
+def test_loneos_archive_url(lid, expected):
+    obs = LONEOS(product_id=lid)
+    assert obs.archive_url == expected
+    assert obs.label_url == expected[:-4] + "xml"
 
-    url = obs.cutout_url(found.ra, found.dec, size=0.1)
-    assert url == (
-        "https://uxzqjwo0ye.execute-api.us-west-1.amazonaws.com/api/images/"
-        "urn:nasa:pds:gbo.ast.spacewatch.survey:data:sw_0996_SW403s_2003_07_08_08_40_33.001.fits"
-        "?ra=12.3&dec=-4.56&size=6.00arcmin&format=fits"
-    )
 
-    url = obs.preview_url(found.ra, found.dec, size=0.1)
-    assert url == (
-        "https://uxzqjwo0ye.execute-api.us-west-1.amazonaws.com/api/images/"
-        "urn:nasa:pds:gbo.ast.spacewatch.survey:data:sw_0996_SW403s_2003_07_08_08_40_33.001.fits"
-        "?ra=12.3&dec=-4.56&size=6.00arcmin&format=jpeg"
+def test_css_telescope():
+    obs = CatalinaLemmon(
+        product_id="urn:nasa:pds:gbo.ast.catalina.survey:data_calibrated:g96_20220130_2b_n27011_01_0001.arch"
     )
+    assert obs.telescope == "Mount Lemmon Survey, 60-inch telescope (G96)"
 
 
-def test_neat_palomar_tricam_urls():
-    obs = NEATPalomarTricam(
-        product_id=(
-            "urn:nasa:pds:gbo.ast.neat.survey:data_tricam:p20011126_obsdata_20011126021342d"
+@pytest.mark.parametrize(
+    "cls, kwargs, ra, dec, archive_url, label_url, cutout_url",
+    [
+        (
+            CatalinaLemmon,
+            {
+                "product_id": "urn:nasa:pds:gbo.ast.catalina.survey:data_calibrated:g96_20220130_2b_n27011_01_0001.arch"
+            },
+            12.3,
+            -4.56,
+            "https://sbnarchive.psi.edu/pds4/surveys/gbo.ast.catalina.survey/data_calibrated/G96/2022/22Jan30/"
+            "G96_20220130_2B_N27011_01_0001.arch.fz",
+            "https://sbnarchive.psi.edu/pds4/surveys/gbo.ast.catalina.survey/data_calibrated/G96/2022/22Jan30/"
+            "G96_20220130_2B_N27011_01_0001.arch.xml",
+            "https://uxzqjwo0ye.execute-api.us-west-1.amazonaws.com/api/images/"
+            "urn:nasa:pds:gbo.ast.catalina.survey:data_calibrated:g96_20220130_2b_n27011_01_0001.arch"
+            "?ra=12.3&dec=-4.56&size=6.00arcmin&format=fits",
         ),
-    )
-    assert obs.archive_url == (
-        "https://sbnarchive.psi.edu/pds4/surveys/gbo.ast.neat.survey/data_tricam/p20011126/"
-        "obsdata/20011126021342d.fit.fz"
-    )
-    assert obs.label_url == (
-        "https://sbnarchive.psi.edu/pds4/surveys/gbo.ast.neat.survey/data_tricam/p20011126/"
-        "obsdata/20011126021342d.xml"
-    )
+        (
+            Spacewatch,
+            {
+                "product_id": (
+                    "urn:nasa:pds:gbo.ast.spacewatch.survey:data:"
+                    "sw_0996_sw403s_2003_07_08_08_40_33.001.fits"
+                ),
+                "file_name": "sw_0996_SW403s_2003_07_08_08_40_33.001.fits",
+            },
+            12.3,
+            -4.56,
+            "https://sbnarchive.psi.edu/pds4/surveys/gbo.ast.spacewatch.survey/data/2003/07/08/"
+            "sw_0996_SW403s_2003_07_08_08_40_33.001.fits",
+            "https://sbnarchive.psi.edu/pds4/surveys/gbo.ast.spacewatch.survey/data/2003/07/08/"
+            "sw_0996_SW403s_2003_07_08_08_40_33.001.xml",
+            "https://uxzqjwo0ye.execute-api.us-west-1.amazonaws.com/api/images/"
+            "urn:nasa:pds:gbo.ast.spacewatch.survey:data:sw_0996_SW403s_2003_07_08_08_40_33.001.fits"
+            "?ra=12.3&dec=-4.56&size=6.00arcmin&format=fits",
+        ),
+        (
+            NEATPalomarTricam,
+            {
+                "product_id": (
+                    "urn:nasa:pds:gbo.ast.neat.survey:data_tricam:p20011126_obsdata_20011126021342d"
+                ),
+            },
+            174.62244,
+            17.97594,
+            "https://sbnarchive.psi.edu/pds4/surveys/gbo.ast.neat.survey/data_tricam/p20011126/"
+            "obsdata/20011126021342d.fit.fz",
+            "https://sbnarchive.psi.edu/pds4/surveys/gbo.ast.neat.survey/data_tricam/p20011126/"
+            "obsdata/20011126021342d.xml",
+            "https://sbnsurveys.astro.umd.edu/api/images/urn:nasa:pds:gbo.ast.neat.survey:"
+            "data_tricam:p20011126_obsdata_20011126021342d?ra=174.62244"
+            "&dec=17.97594&size=6.00arcmin&format=fits",
+        ),
+        (
+            NEATMauiGEODSS,
+            {
+                "product_id": (
+                    "urn:nasa:pds:gbo.ast.neat.survey:data_geodss:g19960514_obsdata_960514061638d"
+                ),
+            },
+            174.62244,
+            17.97594,
+            "https://sbnarchive.psi.edu/pds4/surveys/gbo.ast.neat.survey/data_geodss/g19960514/"
+            "obsdata/960514061638d.fit.fz",
+            "https://sbnarchive.psi.edu/pds4/surveys/gbo.ast.neat.survey/data_geodss/g19960514/"
+            "obsdata/960514061638d.xml",
+            "https://sbnsurveys.astro.umd.edu/api/images/urn:nasa:pds:gbo.ast.neat.survey:"
+            "data_geodss:g19960514_obsdata_960514061638d?ra=174.62244"
+            "&dec=17.97594&size=6.00arcmin&format=fits",
+        ),
+    ],
+    ids=["css", "spacewatch", "neat_palomar_tricam", "neat_maui_geodss"],
+)
+def test_archive_urls(cls, kwargs, ra, dec, archive_url, label_url, cutout_url):
+    obs = cls(**kwargs)
+    assert obs.archive_url == archive_url
+    assert obs.label_url == label_url
 
-    found = Found(ra=174.62244, dec=17.97594)
+    found = Found(ra=ra, dec=dec)
 
     url = obs.cutout_url(found.ra, found.dec, size=0.1)
-    assert url == (
-        "https://sbnsurveys.astro.umd.edu/api/images/urn:nasa:pds:gbo.ast.neat.survey:"
-        "data_tricam:p20011126_obsdata_20011126021342d?ra=174.62244"
-        "&dec=17.97594&size=6.00arcmin&format=fits"
-    )
+    assert url == cutout_url
 
     url = obs.preview_url(found.ra, found.dec, size=0.1)
-    assert url == (
-        "https://sbnsurveys.astro.umd.edu/api/images/urn:nasa:pds:gbo.ast.neat.survey:"
-        "data_tricam:p20011126_obsdata_20011126021342d?ra=174.62244"
-        "&dec=17.97594&size=6.00arcmin&format=jpeg"
-    )
+    assert url == cutout_url[:-4] + "jpeg"
 
 
-def test_neat_maui_geodss_urls():
-    obs = NEATMauiGEODSS(
-        product_id=(
-            "urn:nasa:pds:gbo.ast.neat.survey:data_geodss:g19960514_obsdata_960514061638d"
-        ),
-    )
-    assert obs.archive_url == (
-        "https://sbnarchive.psi.edu/pds4/surveys/gbo.ast.neat.survey/data_geodss/g19960514/"
-        "obsdata/960514061638d.fit.fz"
-    )
-    assert obs.label_url == (
-        "https://sbnarchive.psi.edu/pds4/surveys/gbo.ast.neat.survey/data_geodss/g19960514/"
-        "obsdata/960514061638d.xml"
-    )
-
-    found = Found(ra=174.62244, dec=17.97594)
-
-    url = obs.cutout_url(found.ra, found.dec, size=0.1)
-    assert url == (
-        "https://sbnsurveys.astro.umd.edu/api/images/urn:nasa:pds:gbo.ast.neat.survey:"
-        "data_geodss:g19960514_obsdata_960514061638d?ra=174.62244"
-        "&dec=17.97594&size=6.00arcmin&format=fits"
-    )
-
-    url = obs.preview_url(found.ra, found.dec, size=0.1)
-    assert url == (
-        "https://sbnsurveys.astro.umd.edu/api/images/urn:nasa:pds:gbo.ast.neat.survey:"
-        "data_geodss:g19960514_obsdata_960514061638d?ra=174.62244"
-        "&dec=17.97594&size=6.00arcmin&format=jpeg"
-    )
+@pytest.mark.parametrize("survey", [NEATPalomarTricam, NEATMauiGEODSS])
+def test_neat_cutout_url_coerces_input(survey):
+    obs = survey(product_id="urn:nasa:pds:gbo.ast.neat.survey:data:x")
+    url = obs.cutout_url(1, "-2", size="0.1")
+    assert url.endswith("?ra=1.0&dec=-2.0&size=6.00arcmin&format=fits")
 
 
 def test_ps1dr2_url():
@@ -266,25 +210,28 @@ def test_ps1dr2_url():
         "&ra=332.4875&dec=2.14639&size=360&format=jpeg"
     )
 
+    url = obs.cutout_url(ra=332.4875, dec=2.14639)
+    assert url.endswith("&ra=332.4875&dec=2.14639&size=720&format=fits")
+
 
 def failed_search(self, *args):
     raise Exception
 
 
 def test_source_time_limits(catch):
-    mjd_start, mjd_stop = catch.db.session.query(
-        sa.func.min(NEATMauiGEODSS.mjd_start),
-        sa.func.max(NEATMauiGEODSS.mjd_stop),
-    ).one()
-    assert mjd_start == GEODSS_START
-    assert np.isclose(mjd_stop, 50814.0 + 900 * (EXPTIME + SLEWTIME))
-
-    mjd_start, mjd_stop = catch.db.session.query(
-        sa.func.min(NEATPalomarTricam.mjd_start),
-        sa.func.max(NEATPalomarTricam.mjd_stop),
-    ).one()
-    assert mjd_start == GEODSS_START + TRICAM_OFFSET
-    assert np.isclose(mjd_stop, 50814.0 + 900 * (EXPTIME + SLEWTIME) + TRICAM_OFFSET)
+    limits = [
+        catch.db.session.query(
+            sa.func.min(survey.mjd_start), sa.func.max(survey.mjd_stop)
+        ).one()
+        for survey in (NEATMauiGEODSS, NEATPalomarTricam)
+    ]
+
+    # the last of 900 exposures starts 899 exposure + slew times after the first
+    last_stop = 899 * (EXPTIME + SLEWTIME) + EXPTIME
+    expected = GEODSS_START + np.array(
+        [(0, last_stop), (TRICAM_OFFSET, last_stop + TRICAM_OFFSET)]
+    )
+    np.testing.assert_allclose(limits, expected, rtol=1e-10)
 
 
 @pytest.mark.remote_data
@@ -308,8 +255,8 @@ def test_query_moving_target(catch):
     queries = catch.queries_from_job_id(job_id)
     assert all([q.execution_time > 0 for q in queries])
 
-    for source in (NEATMauiGEODSS, NEATPalomarTricam):
-        assert sum([isinstance(c[1], source) for c in caught]) == 1
+    counts = Counter(type(c[1]) for c in caught)
+    assert counts == {NEATMauiGEODSS: 1, NEATPalomarTricam: 1}
 
     # new query using a MovingTarget
     job_id = uuid.uuid4()
@@ -452,18 +399,19 @@ def test_cache(catch):
     assert cached
 
 
+def get_survey_stats(catch: Catch, criterion) -> SurveyStats:
+    """Get the single survey statistics row matching ``criterion``."""
+    return catch.db.session.execute(
+        sa.select(SurveyStats).where(criterion)
+    ).scalar_one()
+
+
 def test_update_statistics(catch):
     catch.update_statistics()
-    stats = (
-        catch.db.session.query(SurveyStats)
-        .filter(SurveyStats.source == "neat_maui_geodss")
-        .one()
-    )
+    stats = get_survey_stats(catch, SurveyStats.source == "neat_maui_geodss")
     assert stats.count == 900
 
-    all_stats: SurveyStats = (
-        catch.db.session.query(SurveyStats).filter(SurveyStats.name == "All").one()
-    )
+    all_stats = get_survey_stats(catch, SurveyStats.name == "All")
     assert all_stats.count == 1800
 
     start = Time(GEODSS_START, format="mjd")
@@ -471,46 +419,33 @@ def test_update_statistics(catch):
     assert stats.start_date == start.iso
     assert stats.stop_date == stop.iso
 
-    fov = np.array(((-0.5, 0.5, 0.5, -0.5), (-0.5, -0.5, 0.5, 0.5))) * 5
     obs = NEATMauiGEODSS(
         mjd_start=stop.mjd,
         mjd_stop=stop.mjd + EXPTIME + SLEWTIME,
         product_id="asdf",
     )
-    obs.set_fov(*fov)
+    obs.set_fov(*FOV_TEMPLATE)
 
     # add the new observation, update the other survey, and verify that the
     # GEODSS stats have not changed
     catch.add_observations([obs])
     catch.update_statistics(source="neat_palomar_tricam")
-    stats = (
-        catch.db.session.query(SurveyStats)
-        .filter(SurveyStats.source == "neat_maui_geodss")
-        .one()
-    )
+    stats = get_survey_stats(catch, SurveyStats.source == "neat_maui_geodss")
     assert stats.count == 900
 
-    all_stats: SurveyStats = (
-        catch.db.session.query(SurveyStats).filter(SurveyStats.name == "All").one()
-    )
+    all_stats = get_survey_stats(catch, SurveyStats.name == "All")
     assert all_stats.count == 1800
 
     # now update GEODSS and check stats
     catch.update_statistics(source="neat_maui_geodss")
-    stats = (
-        catch.db.session.query(SurveyStats)
-        .filter(SurveyStats.source == "neat_maui_geodss")
-        .one()
-    )
+    stats = get_survey_stats(catch, SurveyStats.source == "neat_maui_geodss")
     assert stats.count == 901
     start = Time(GEODSS_START, format="mjd")
     stop = Time(GEODSS_START + EXPTIME * 901 + SLEWTIME * 900, format="mjd")
     assert stats.start_date == start.iso
     assert stats.stop_date == stop.iso
 
-    all_stats = (
-        catch.db.session.query(SurveyStats).filter(SurveyStats.name == "All").one()
-    )
+    all_stats = get_survey_stats(catch, SurveyStats.name == "All")
     assert all_stats.count == 1801
     assert all_stats.start_date == start.iso
     stop = Time(
@@ -522,7 +457,7 @@ def test_update_statistics(catch):
 
 
 def test_status_updates(catch: Catch):
-    updates = catch.status_updates()
+    updates = stats.recently_added_observations(catch)
 
     assert len(updates) == 6
 
@@ -566,6 +501,43 @@ def test_status_updates(catch: Catch):
     test["stop_date"] = "1998-01-01 00:18:23.000"
     assert test in updates
 
+    # limit to one source
+    updates = stats.recently_added_observations(catch, sources=["neat_maui_geodss"])
+    assert len(updates) == 3
+    assert test in updates
+    assert all(update["source"] == "neat_maui_geodss" for update in updates)
+
+
+def test_recent_queries(catch: Catch):
+    date = Time.now().iso
+    for status, execution_time in [
+        ("finished", 1.0),
+        ("finished", None),
+        ("errored", None),
+    ]:
+        catch.db.session.add(
+            CatchQuery(
+                job_id=uuid.uuid4().hex,
+                source="neat_maui_geodss",
+                status=status,
+                execution_time=execution_time,
+                date=date,
+            )
+        )
+    catch.db.session.commit()
+
+    summary = stats.recent_queries(catch)
+    assert len(summary) == 3
+    for row, days in zip(summary, [1, 7, 30]):
+        assert row == {
+            "days": days,
+            "jobs": 3,
+            "finished": 2,
+            "cached": 1,
+            "errored": 1,
+            "in_progress": 0,
+        }
+
 
 def test_fixed_target_point_search(catch: Catch):
     target = FixedTarget.from_radec("00 05 00", "-30 15 00", unit=("hourangle", "deg"))
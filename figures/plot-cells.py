@@ -1,4 +1,5 @@
 import argparse
+import functools
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.collections import PolyCollection
@@ -7,6 +8,7 @@ from spherical_geometry.polygon import (
     great_circle_arc,
     vector,
 )
+from sqlalchemy import select
 from catch import Catch, Config, model
 from sbsearch.core import line_to_segment_query_terms
 from sbsearch.spatial import term_to_cell_vertices
@@ -23,7 +25,13 @@ config = Config(
 )
 
 
-def quad_to_poly(ra, dec, **kwargs):
+@functools.lru_cache(maxsize=None)
+def decode_term(term):
+    """Cell vertices (ra, dec) in radians, for a term without the $ prefix."""
+    return term_to_cell_vertices(term.encode())
+
+
+def quad_to_vertices(ra, dec):
     p = SphericalPolygon.from_radec(ra, dec, degrees=True)
 
     points = p.polygons[0]._points
@@ -43,80 +51,63 @@ def quad_to_poly(ra, dec, **kwargs):
     _ra.append(lon1)
     _dec.append(lat1)
 
-    return _ra, _dec, PolyCollection([np.c_[_ra, _dec]], **kwargs)
+    return np.c_[_ra, _dec]
 
 
-def fov_to_poly(fov, **kwargs):
+def fov_to_vertices(fov):
     ra, dec = np.array([c.split(':') for c in fov.split(',')], float).T
     ra = np.r_[ra, ra[0]]
     dec = np.r_[dec, dec[0]]
-    return quad_to_poly(ra, dec, **kwargs)
+    return quad_to_vertices(ra, dec)
 
 
-def cell_to_poly(radec, **kwargs):
+def cell_to_vertices(radec):
     ra = np.r_[radec[0], radec[0, 0]]
     ra[ra < 0] += 360
     dec = np.r_[radec[1], radec[1, 0]]
-    return quad_to_poly(ra, dec, **kwargs)
+    return quad_to_vertices(ra, dec)
 
 
 with Catch.with_config(config) as catch:
-    spatial_terms, fov = (
-        catch.db.session.query(model.Observation.spatial_terms,
-                               model.Observation.fov)
-        .filter(model.Observation.observation_id == args.observation_id)
-        .one()
-    )
-    cells = {term: np.degrees(term_to_cell_vertices(term.lstrip("$").encode()))
-             for term in spatial_terms}
+    spatial_terms, fov = catch.db.session.execute(
+        select(model.Observation.spatial_terms, model.Observation.fov)
+        .where(model.Observation.observation_id == args.observation_id)
+    ).one()
+    # the indexer provides ancestor terms for each covering term, but don't
+    # plot them
+    covering_terms = {term[1:] for term in spatial_terms
+                      if term.startswith('$')}
+    spatial_terms = [term for term in spatial_terms
+                     if term.startswith('$') or term not in covering_terms]
+    vertices = [decode_term(term.lstrip("$")) for term in spatial_terms]
+    cells = dict(zip(spatial_terms, np.degrees(vertices)))
 
 fig = plt.figure(1, (8, 4))
 fig.clear()
 lax = fig.add_subplot(121)
 rax = fig.add_subplot(122)
 
+fov_vertices = fov_to_vertices(fov)
 for ax in (lax, rax):
-    poly = fov_to_poly(fov, color='k', fc='none', lw=0.75, zorder=99)[2]
-    ax.add_artist(poly)
-
-labeled = []
-covering_terms = [k[1:] for k in cells.keys() if k.startswith('$')]
-ancestor_terms = [k for k in cells.keys() if k not in covering_terms]
-for term, cell in cells.items():
-    if term.startswith('$'):
-        fc = 'tab:red'
-        alpha = 0.5
-        if '$' not in labeled:
-            label = 'Covering cells'
-            labeled.append('$')
-        else:
-            label = ''
-        ax = lax
-    elif term in ancestor_terms:
-        fc = 'tab:blue'
-        alpha = 0.5
-        if '' not in labeled:
-            label = 'Ancestor cells'
-            labeled.append('')
-        else:
-            label = ''
-        ax = rax
-    else:
-        # the indexer provides ancestor terms for each covering term, but don't
-        # plot them
-        continue
-
-    ra, dec, poly = cell_to_poly(cell, color='k', fc=fc, lw=0.75,
-                                 alpha=alpha, label=label)
-    ax.add_artist(poly)
+    ax.add_collection(PolyCollection([fov_vertices], color='k', fc='none',
+                                     lw=0.75, zorder=99))
+
+# one collection per group of cells
+covering = [cell_to_vertices(cell) for term, cell in cells.items()
+            if term.startswith('$')]
+ancestors = [cell_to_vertices(cell) for term, cell in cells.items()
+             if not term.startswith('$')]
+lax.add_collection(PolyCollection(covering, color='k', fc='tab:red',
+                                  lw=0.75, alpha=0.5, label='Covering cells'))
+rax.add_collection(PolyCollection(ancestors, color='k', fc='tab:blue',
+                                  lw=0.75, alpha=0.5, label='Ancestor cells'))
 
 if args.terms is not None:
-    for term in args.terms:
-        cell = np.degrees(term_to_cell_vertices(term.lstrip("$").encode()))
-        for ax in (lax, rax):
-            ra, dec, poly = cell_to_poly(
-                cell, color='tab:red', fc='none', lw=0.75)
-            ax.add_artist(poly)
+    vertices = [decode_term(term.lstrip("$")) for term in args.terms]
+    extra = [cell_to_vertices(cell) for cell in np.degrees(vertices)]
+    for ax in (lax, rax):
+        ax.add_collection(PolyCollection(extra, color='tab:red', fc='none',
+                                         lw=0.75))
 
 ra = np.r_[[ra for (ra, dec) in cells.values()]] % 360
 dec = np.r_[[dec for (ra, dec) in cells.values()]]
@@ -7,7 +7,7 @@ Instead, download a copy of the observation database (or subsets):
 
 Examples:
 
-    python3 plot-sky-coverage.py --source=skymapper
+    python3 plot-sky-coverage.py --source=skymapper_dr4
     python3 plot-sky-coverage.py --source=neat_palomar_tricam
     python3 plot-sky-coverage.py --source=neat_maui_geodss
 
@@ -21,8 +21,15 @@ import os
 import sys
 import shlex
 import argparse
+import itertools
 import logging
 from collections import Counter
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    as_completed,
+    wait,
+)
 
 import numpy as np
 import matplotlib as mpl
@@ -44,55 +51,92 @@ from catch.model import Observation
 
 
 def radec_to_fov(ra, dec):
-    values = []
-    _ra = (ra + 360) % 360
-    for i in range(len(ra)):
-        values.append(f"{_ra[i]:.6f}:{dec[i]:.6f}")
-    return ",".join(values)
+    """Format (N, 4) arrays of vertices, in degrees, as N fov strings."""
+    _ra = np.char.mod("%.6f", (ra + 360) % 360)
+    _dec = np.char.mod("%.6f", dec)
+    vertices = np.char.add(np.char.add(_ra, ":"), _dec)
+    return [",".join(v) for v in vertices.tolist()]
 
 
 def fields_of_view(fn, source=None):
+    # match the whole source column, e.g., not catalina_bigelow for catalina
+    prefix = None if source is None else source + ","
     with open(fn, "r") as inf:
         inf.readline()  # skip the required header
         for line in inf:
-            if (source is not None) and not line.startswith(source):
+            if (prefix is not None) and not line.startswith(prefix):
                 continue
 
             logger.debug(line[:-1])
 
-            ra, dec = polygon_string_to_arrays(
-                line[line.index(",") + 2 : -2]  # noqa: E203
-            )
-            ra = Angle(ra, "rad").wrap_at(180 * u.deg).rad
-            vertices = []
-            for i in range(4):
-                vertices.append(s2.S2LatLng.FromRadians(dec[i], ra[i]).ToPoint())
+            yield line[line.index(",") + 2 : -2]  # noqa: E203
+
+
+def fov_to_polygon(fov):
+    ra, dec = polygon_string_to_arrays(fov)
+    ra = (ra + np.pi) % (2 * np.pi) - np.pi  # wrap at 180 deg
+    vertices = []
+    for i in range(4):
+        vertices.append(s2.S2LatLng.FromRadians(dec[i], ra[i]).ToPoint())
 
-            loop = s2.S2Loop(vertices)
-            loop.Normalize()
-            poly = s2.S2Polygon(loop)
-            yield poly
+    loop = s2.S2Loop(vertices)
+    loop.Normalize()
+    return s2.S2Polygon(loop)
 
 
-def cell_sky_coverage(fovs, level):
+def count_cell_terms(fovs, level):
+    """Count the index terms of each field of view in a batch.
+
+    Runs in a worker process: S2 objects cannot be pickled, so the
+    polygons are built here from the fov strings.
+
+    """
+
     counter = Counter()
     indexer = s2.S2RegionTermIndexer()
     indexer.set_fixed_level(level)
+    for fov in fovs:
+        counter.update(indexer.GetIndexTerms(fov_to_polygon(fov), ""))
+    return counter
+
 
+def batched(iterable, n):
+    # itertools.batched requires Python 3.12
+    iterator = iter(iterable)
+    while batch := list(itertools.islice(iterator, n)):
+        yield batch
+
+
+def cell_sky_coverage(fovs, level, workers=None, batch_size=10000):
+    counter = Counter()
     tri = ProgressTriangle(1, logger)
-    for region in fovs:
-        terms = indexer.GetIndexTerms(region, "")
-        counter.update(terms)
-        tri.update()
-
-    cells = []
-    count = []
-    fov = []
-    for cell, n in counter.items():
-        cells.append(cell)
-        count.append(n)
-        ra, dec = np.degrees(term_to_cell_vertices(cell))
-        fov.append(radec_to_fov(ra, dec))
+
+    def collect(future, n):
+        counter.update(future.result())
+        for _ in range(n):
+            tri.update()
+
+    # stream the fields of view: keep at most two batches per process in
+    # flight, rather than queuing the whole file
+    workers = os.cpu_count() if workers is None else workers
+    pending = {}
+    with ProcessPoolExecutor(workers) as executor:
+        for batch in batched(fovs, batch_size):
+            if len(pending) >= 2 * workers:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    collect(future, pending.pop(future))
+            pending[executor.submit(count_cell_terms, batch, level)] = len(batch)
+
+        for future in as_completed(pending):
+            collect(future, pending[future])
+
+    cells = list(counter.keys())
+    count = list(counter.values())
+    vertices = np.degrees(
+        np.reshape([term_to_cell_vertices(cell) for cell in cells], (-1, 2, 4))
+    )
+    fov = radec_to_fov(vertices[:, 0], vertices[:, 1])
 
     return np.array(cells), np.array(count), np.array(fov)
 
@@ -199,6 +243,11 @@ if __name__ == "__main__":
         action="store_true",
         help="ignore previous saved file and reprocess",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="number of processes for computing cell coverage (default: all CPUs)",
+    )
     parser.add_argument("-v", action="store_true", help="show debug messages")
     args = parser.parse_args()
 
@@ -224,7 +273,7 @@ if __name__ == "__main__":
         fov = tab["fov"].data
     else:
         fovs = fields_of_view("observations.csv", args.source)
-        cells, count, fov = cell_sky_coverage(fovs, args.level)
+        cells, count, fov = cell_sky_coverage(fovs, args.level, workers=args.workers)
 
         tab = Table((cells, count, fov), names=("cell", "count", "fov"))
         tab.sort("cell")